@@ -0,0 +1,106 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+텍스트 Fallback의 괄호 짝 맞추기 / 인자 분리 루프를 C 레벨로 옮긴 선택 확장 모듈.
+
+빌드: cythonize -i src/_scan.pyx
+빌드하지 않으면 ast_parser의 순수 Python 구현이 그대로 사용됩니다.
+"""
+
+
+from libc.stdint cimport uint64_t
+from libc.string cimport memcpy
+
+
+cdef extern from *:
+    int __builtin_ctzll(unsigned long long) nogil
+
+
+cdef uint64_t _ONES = 0x0101010101010101ULL
+cdef uint64_t _HIGH = 0x8080808080808080ULL
+
+
+cdef inline uint64_t _byte_hits(uint64_t word, uint64_t pattern) noexcept nogil:
+    # High bit set in lanes equal to the broadcast byte; the lowest set lane is exact
+    cdef uint64_t x = word ^ pattern
+    return (x - _ONES) & ~x & _HIGH
+
+
+cdef Py_ssize_t _find_matching(
+    const unsigned char[::1] text,
+    Py_ssize_t open_index,
+    unsigned char opener,
+    unsigned char closer,
+) noexcept nogil:
+    """
+    8바이트 단위(SWAR)로 opener/closer가 없는 구간을 건너뛰고,
+    가장 낮은 적중 lane의 바이트만 depth 계산에 사용합니다.
+    """
+    cdef Py_ssize_t n = text.shape[0]
+    cdef Py_ssize_t i = open_index + 1
+    cdef Py_ssize_t depth = 1
+    cdef uint64_t open_pattern = _ONES * opener
+    cdef uint64_t close_pattern = _ONES * closer
+    cdef uint64_t word, hits
+    cdef const unsigned char* base
+    cdef unsigned char c
+
+    if n == 0:
+        return -1
+    base = &text[0]
+
+    while i < n:
+        if i + 8 <= n:
+            memcpy(&word, base + i, 8)
+            hits = _byte_hits(word, open_pattern) | _byte_hits(word, close_pattern)
+            if hits == 0:
+                i += 8
+                continue
+            # Lanes are little-endian byte order in the loaded word
+            i += __builtin_ctzll(hits) >> 3
+        c = base[i]
+        if c == opener:
+            depth += 1
+        elif c == closer:
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return -1
+
+
+def find_matching(
+    const unsigned char[::1] text,
+    Py_ssize_t open_index,
+    unsigned char opener,
+    unsigned char closer,
+) -> int:
+    """text[open_index]의 opener와 짝이 맞는 closer의 offset (없으면 -1)."""
+    return _find_matching(text, open_index, opener, closer)
+
+
+def split_arguments(str argument_block) -> list:
+    """최상위(depth 0) 콤마 기준으로 인자를 분리 (각 인자는 strip, 빈 인자는 제외)."""
+    cdef list arguments = []
+    cdef Py_ssize_t depth = 0
+    cdef Py_ssize_t start = 0
+    cdef Py_ssize_t i = 0
+    cdef Py_UCS4 c
+    cdef str argument
+
+    for c in argument_block:
+        if c == u",":
+            if depth == 0:
+                argument = argument_block[start:i].strip()
+                if argument:
+                    arguments.append(argument)
+                start = i + 1
+        elif c == u"(" or c == u"{" or c == u"[":
+            depth += 1
+        elif c == u")" or c == u"}" or c == u"]":
+            depth -= 1
+        i += 1
+
+    argument = argument_block[start:].strip()
+    if argument:
+        arguments.append(argument)
+    return arguments
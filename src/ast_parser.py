@@ -1,36 +1,227 @@
+import bisect
 import json
+import mmap
 import os
 import re
-from dataclasses import dataclass
-from functools import lru_cache
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .cache_helper import DiskCache, default_cache_dir, digest_key, file_digest
 
 try:
     from clang import cindex
 except ImportError:  # pragma: no cover - optional dependency guard
     cindex = None  # type: ignore[misc]
 
+try:
+    from . import _scan
+except ImportError:  # pragma: no cover - optional C extension (cythonize -i src/_scan.pyx)
+    _scan = None  # type: ignore[misc]
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency guard
+    hyperscan = None  # type: ignore[misc]
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency guard
+    re2 = None  # type: ignore[misc]
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency guard
+    np = None  # type: ignore[misc]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency guard
+    orjson = None  # type: ignore[misc]
+
+
+# Text-fallback macro patterns (used when libclang is unavailable or fails).
+# Shared prefixes are folded into one branch each; names are matched case-sensitively.
+SYS_CALL_MACRO_ALTERNATIVES: Tuple[bytes, ...] = (
+    rb"INTERNAL_SYSCALL(?:_DECL|_CALL)?",
+    rb"INLINE_SYSCALL",
+    rb"SYSCALL_CANCEL(?:_IF)?",
+    rb"__libc_do_syscall",
+    rb"internal_syscall[0-6]",
+    rb"__open(?:at)?_nocancel",
+)
+# Literal prefixes of the alternatives: a file containing none of them has no macro call
+SYS_CALL_MACRO_LITERALS: Tuple[bytes, ...] = (
+    b"INLINE_SYSCALL",
+    b"INTERNAL_SYSCALL",
+    b"SYSCALL_CANCEL",
+    b"__libc_do_syscall",
+    b"internal_syscall",
+    b"__open_nocancel",
+    b"__openat_nocancel",
+)
+SYS_CALL_MACRO_PATTERN = re.compile(rb"(" + rb"|".join(SYS_CALL_MACRO_ALTERNATIVES) + rb")\s*\(")
+
+# Token text of a syscall site: "( kernel , [nargs ,] rest )"
+CALL_ARGUMENTS_PATTERN = re.compile(
+    r"\(\s*(?P<kernel>[^,]+)\s*,\s*(?:(?P<nargs>[0-9]+)\s*,)?(?P<rest>.*)\)\s*$"
+)
+
+# "name(...)" immediately before a candidate means it is a call, not a definition
+PRECEDING_CALL_PATTERN = re.compile(rb"[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*$")
+
+# Optional whitespace and the "(" that must follow a definition anchor
+OPEN_PAREN_PATTERN = re.compile(rb"\s*\(")
+
+# Bytes that continue an identifier (word characters of a bytes regex)
+IDENTIFIER_BYTES = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_")
+
+# Characters that matter when splitting a macro argument list
+ARGUMENT_DELIMITER_PATTERN = re.compile(r"[,(){}\[\]]")
 
-# Text-fallback macro patterns (used when libclang is unavailable or fails)
-SYS_CALL_MACRO_PATTERN = re.compile(
-    r"(INLINE_SYSCALL|INTERNAL_SYSCALL|INTERNAL_SYSCALL_DECL|INTERNAL_SYSCALL_CALL|"
-    r"SYSCALL_CANCEL|SYSCALL_CANCEL_IF|__libc_do_syscall|"
-    r"internal_syscall[0-6]|__open_nocancel|__openat_nocancel)\s*\(",
-    re.MULTILINE | re.IGNORECASE,
+# Argument blocks shorter than this are split with finditer (measured NumPy break-even ~1.5-2 KB)
+NUMPY_SPLIT_MIN_LENGTH = 2048
+
+# Bodies at least this long use the literal-anchor macro search; the regex wins below (~512 B break-even)
+MACRO_LITERAL_SEARCH_MIN_LENGTH = 512
+
+# Bump whenever extraction logic changes so cached parse results are invalidated
+RESULT_CACHE_VERSION = 10
+
+# Files without any of these cannot change under -D_TIME_BITS=64 (round 2 prefilter)
+TIME64_NEEDLE_PATTERN = re.compile(
+    rb"time64|_TIME_BITS|TIME_BITS64|timespec|timeval|\btime_t\b"
 )
 
+# Identifier tokens recorded in the symbol -> files index
+IDENTIFIER_PATTERN = re.compile(rb"[A-Za-z_][A-Za-z0-9_]{2,}")
+
+# Keywords that open an inline asm statement inside a function body
+INLINE_ASM_KEYWORDS = frozenset({"asm", "__asm", "__asm__"})
+
+# Text fallback sources at least this large are mmap'd rather than read into bytes
+MMAP_READ_THRESHOLD = 256 * 1024
+
+# Upper bound on files checked by the signature-only parse in _pick_defining_file
+MAX_SIGNATURE_CANDIDATES = 32
+
+# Tokens after which an asm keyword starts a statement rather than an asm label
+STATEMENT_BOUNDARY_TOKENS = frozenset({";", "{", "}", ":", "else"})
+
+# Directories under the glibc root that never contain wrapper sources
+SKIPPED_SOURCE_DIRS = frozenset({".git", "po", "manual"})
+
+
+class _IfConditionTable:
+    """
+    FUNCTION_DECL 하나 안의 IF_STMT (시작 offset, 끝 offset, 조건식) 목록.
+    syscall 지점의 offset으로 가장 안쪽 if를 이분 탐색합니다.
+    """
 
-@dataclass(frozen=True)
+    __slots__ = ("_starts", "_ranges")
+
+    def __init__(self, ranges: List[Tuple[int, int, str]]) -> None:
+        ranges.sort(key=lambda item: item[0])
+        self._ranges = ranges
+        self._starts = [start for start, _, _ in ranges]
+
+    def lookup(self, offset: int) -> str:
+        idx = bisect.bisect_right(self._starts, offset) - 1
+        # Nested ifs start later, so the first enclosing range walking back is the innermost
+        while idx >= 0:
+            start, end, text = self._ranges[idx]
+            if start <= offset < end:
+                return text
+            idx -= 1
+        return ""
+
+
+@dataclass(frozen=True, slots=True)
 class SyscallCallInfo:
     kernel_symbol: str
-    raw_arguments: List[str]
+    raw_arguments: Sequence[str]
     conditional_context: str
     source_location: str
     origin_macro: str
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
+class SyscallTable:
+    """
+    Struct-of-Arrays 형태의 분석 결과: 행 i의 각 필드는 컬럼 리스트의 i번째 원소.
+    by_wrapper는 wrapper 이름 -> 행 인덱스 목록이며, SyscallCallInfo는 row()/rows()로
+    필요할 때만 만들어집니다.
+    wrapper/커널 심볼/매크로 이름은 종류가 적고 반복이 많으므로 sys.intern으로 한 벌만 유지합니다.
+    """
+
+    kernel_symbol: List[str] = field(default_factory=list)
+    raw_arguments: List[Tuple[str, ...]] = field(default_factory=list)
+    conditional_context: List[str] = field(default_factory=list)
+    source_location: List[str] = field(default_factory=list)
+    origin_macro: List[str] = field(default_factory=list)
+    by_wrapper: DefaultDict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
+
+    def __len__(self) -> int:
+        return len(self.kernel_symbol)
+
+    def __contains__(self, wrapper: object) -> bool:
+        return wrapper in self.by_wrapper
+
+    def append(
+        self,
+        wrapper: str,
+        kernel_symbol: str,
+        raw_arguments: Sequence[str],
+        conditional_context: str,
+        source_location: str,
+        origin_macro: str,
+    ) -> None:
+        self.by_wrapper[sys.intern(wrapper)].append(len(self.kernel_symbol))
+        self.kernel_symbol.append(sys.intern(kernel_symbol))
+        self.raw_arguments.append(tuple(raw_arguments))
+        self.conditional_context.append(conditional_context)
+        self.source_location.append(source_location)
+        self.origin_macro.append(sys.intern(origin_macro))
+
+    def extend(self, other: "SyscallTable") -> None:
+        """
+        other의 행을 뒤에 이어 붙입니다 (컬럼 단위 list.extend + 인덱스 오프셋).
+        워커/캐시에서 unpickle된 문자열은 intern이 풀려 있으므로 여기서 다시 intern합니다.
+        """
+        offset = len(self)
+        self.kernel_symbol.extend(map(sys.intern, other.kernel_symbol))
+        self.raw_arguments.extend(other.raw_arguments)
+        self.conditional_context.extend(other.conditional_context)
+        self.source_location.extend(other.source_location)
+        self.origin_macro.extend(map(sys.intern, other.origin_macro))
+        for wrapper, rows in other.by_wrapper.items():
+            self.by_wrapper[sys.intern(wrapper)].extend(row + offset for row in rows)
+
+    def wrappers(self) -> Iterable[str]:
+        return self.by_wrapper.keys()
+
+    def row(self, index: int) -> SyscallCallInfo:
+        return SyscallCallInfo(
+            kernel_symbol=self.kernel_symbol[index],
+            raw_arguments=self.raw_arguments[index],
+            conditional_context=self.conditional_context[index],
+            source_location=self.source_location[index],
+            origin_macro=self.origin_macro[index],
+        )
+
+    def rows(self, wrapper: str) -> List[SyscallCallInfo]:
+        return [self.row(index) for index in self.by_wrapper.get(wrapper, ())]
+
+    def to_mapping(self) -> Dict[str, List[SyscallCallInfo]]:
+        return {wrapper: self.rows(wrapper) for wrapper in self.by_wrapper}
+
+
+@dataclass(frozen=True, slots=True)
 class SyscallExtractionResult:
     source_path: Path
     macro_name: str
@@ -39,10 +230,9 @@ class SyscallExtractionResult:
     function_signature: str
 
     def as_payload(self) -> Dict[str, Any]:
-        mapping = [{"strategy": "raw", "value": argument.strip()} for argument in self.raw_arguments]
         return {
             "kernel_syscall": self.kernel_symbol,
-            "args_mapping_json": json.dumps(mapping, ensure_ascii=False),
+            "args_mapping_json": _args_mapping_json(self.raw_arguments),
             "macro_name": self.macro_name,
             "source_path": str(self.source_path),
             "status": "parsed",
@@ -73,13 +263,29 @@ class GlibcAstParser:
         "__libc_do_syscall",
     )
 
-    def __init__(self, glibc_root: Path, target_arch: str) -> None:
+    def __init__(
+        self,
+        glibc_root: Path,
+        target_arch: str,
+        cache_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
         self.glibc_root = glibc_root
         self.target_arch = target_arch
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._source_files: Optional[List[Path]] = None
+        self._symbol_to_files: Optional[Dict[bytes, List[Path]]] = None
+        # Digest of the (path, mtime, size) list the index was built from; also keys defining-file picks
+        self._symbol_index_key: Optional[str] = None
+        self._index_cache = DiskCache(self.cache_dir, "symbol_index")
+        self._result_cache = DiskCache(self.cache_dir, "parse_results")
 
         if cindex is not None:
             self._initialise_libclang()
 
+        self._macro_db = _build_macro_database()
+
     # ----------------------------- Public APIs ----------------------------- #
     def run_full_analysis(
         self,
@@ -87,36 +293,72 @@ class GlibcAstParser:
         target_macros: Optional[List[str]] = None,
         c_files: Optional[List[Path]] = None,
         enable_time64_round: bool = True,
-    ) -> Dict[str, List[SyscallCallInfo]]:
+    ) -> SyscallTable:
         """
         모든 .c 파일을 대상으로 다중 라운드 파싱을 수행하여
-        wrapper 함수 이름 -> SyscallCallInfo 리스트 매핑을 생성합니다.
+        wrapper 함수 이름 -> SyscallCallInfo 행 테이블(SyscallTable)을 생성합니다.
+        dict 형태가 필요하면 to_mapping()을 사용하세요.
         """
         macros = tuple(target_macros) if target_macros else self.DEFAULT_TARGET_MACROS
         base_flags = clang_args or self._build_default_clang_args()
         files = c_files or self._discover_source_files()
 
-        union_results: Dict[str, List[SyscallCallInfo]] = {}
+        union_results = SyscallTable()
+        if cindex is None:
+            print("[glibc-parser] WARN: libclang not available, skipping AST parsing")
+            return union_results
+
+        # Files that never spell a target macro or an asm keyword cannot yield a token-scan hit
+        candidates = self._filter_files_by_needle(files, _macro_needle(macros))
+        if len(candidates) != len(files):
+            print(f"[glibc-parser] Skipping {len(files) - len(candidates)} file(s) without target macros or asm")
 
         # Round 1: base flags
-        results_base = self._parsing_loop(files, base_flags, macros)
-        _merge_results(union_results, results_base)
+        results_base = self._parsing_loop(candidates, base_flags, macros)
+        union_results.extend(results_base)
 
-        # Round 2: _TIME_BITS=64
+        # Round 2: _TIME_BITS=64 (only candidates that can compile differently under it)
         if enable_time64_round:
             time64_flags = list(base_flags) + ["-D_TIME_BITS=64", "-D__USE_TIME_BITS64=1"]
-            results_time64 = self._parsing_loop(files, time64_flags, macros)
-            _merge_results(union_results, results_time64)
+            time64_files = self._filter_files_by_needle(candidates, TIME64_NEEDLE_PATTERN)
+            results_time64 = self._parsing_loop(time64_files, time64_flags, macros)
+            union_results.extend(results_time64)
 
         return union_results
 
-    def parse_wrapper_function(self, symbol: str) -> Dict[str, Any]:
+    def parse_wrapper_functions(
+        self,
+        symbols: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 심볼에 대해 parse_wrapper_function 결과를 입력 순서대로 반환.
+        소스 파일 위치는 driver에서 한 번만 찾고, 워커에는 (심볼, 파일 경로)만 전달합니다.
+        """
+        workers = self.max_workers if max_workers is None else max_workers
+        targets = [(symbol, self._locate_symbol_source(symbol)) for symbol in symbols]
+        if workers <= 1 or len(targets) <= 1:
+            return [self.parse_wrapper_function(symbol, source_path) for symbol, source_path in targets]
+
+        workers = min(workers, len(targets))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_parse_worker,
+            initargs=(self.glibc_root, self.target_arch, self.cache_dir),
+        ) as executor:
+            return list(
+                executor.map(_parse_wrapper_one, targets, chunksize=max(1, len(targets) // (workers * 4)))
+            )
+
+    def parse_wrapper_function(self, symbol: str, source_path: Optional[Path] = None) -> Dict[str, Any]:
         """
         Backward-compatible API for earlier PoC step.
         v2 내부 구현을 유지하되, 단일 심볼에 대한 결과만 반환.
+        source_path를 넘기면 파일 탐색을 건너뜁니다.
         """
         # Try v2 multi-pass over likely file(s) containing symbol
-        source_path = self._locate_symbol_source(symbol)
+        if source_path is None:
+            source_path = self._locate_symbol_source(symbol)
         if source_path is None:
             return {
                 "status": "symbol_not_found",
@@ -132,15 +374,12 @@ class GlibcAstParser:
                     c_files=[source_path],
                     enable_time64_round=True,
                 )
-                if symbol in results and results[symbol]:
-                    first = results[symbol][0]
+                if symbol in results:
+                    first = results.row(results.by_wrapper[symbol][0])
                     print(f"[glibc-parser] libclang parsing succeeded for `{symbol}`")
                     return {
                         "kernel_syscall": first.kernel_symbol,
-                        "args_mapping_json": json.dumps(
-                            [{"strategy": "raw", "value": arg} for arg in first.raw_arguments],
-                            ensure_ascii=False,
-                        ),
+                        "args_mapping_json": _args_mapping_json(first.raw_arguments),
                         "macro_name": first.origin_macro,
                         "source_path": first.source_location,
                         "status": "parsed",
@@ -171,6 +410,27 @@ class GlibcAstParser:
         print(f"[glibc-parser] Text-based parsing succeeded for `{symbol}`")
         return result.as_payload()
 
+    def result_fingerprint(self, symbol: str) -> Optional[str]:
+        """
+        parse_wrapper_function(symbol) 결과를 외부 캐시(예: Redis)에 저장할 때 쓰는 키.
+        정의 파일의 내용 해시 기반이므로 mtime이 바뀌어도(다른 Pod, 재체크아웃) 재사용됩니다.
+        헤더 변경은 반영되지 않으므로 외부 캐시에는 TTL을 두세요.
+        """
+        source_path = self._locate_symbol_source(symbol)
+        if source_path is None:
+            return None
+        try:
+            content = file_digest(source_path)
+        except OSError:
+            return None
+        try:
+            relative = source_path.relative_to(self.glibc_root)
+        except ValueError:
+            relative = source_path
+        return digest_key(
+            (RESULT_CACHE_VERSION, self.target_arch, cindex is not None, symbol, str(relative), content)
+        )
+
     # ----------------------- libclang initialisation ----------------------- #
     def _initialise_libclang(self) -> None:
         libclang_path = os.getenv("LIBCLANG_PATH")
@@ -210,7 +470,13 @@ class GlibcAstParser:
         return args
 
     def _discover_source_files(self) -> List[Path]:
-        return [p for p in self.glibc_root.rglob("*.c")]
+        """
+        glibc_root 아래 .c 파일 목록. 한 번만 순회하고 인스턴스에 캐시하여
+        run_full_analysis와 _search_globally가 같은 목록을 공유합니다.
+        """
+        if self._source_files is None:
+            self._source_files = list(_iter_c_files(self.glibc_root))
+        return self._source_files
 
     # -------------------------- Multi-pass parsing ------------------------- #
     def _parsing_loop(
@@ -218,36 +484,84 @@ class GlibcAstParser:
         files: List[Path],
         clang_args: List[str],
         target_macros: Tuple[str, ...],
-    ) -> Dict[str, List[SyscallCallInfo]]:
+    ) -> SyscallTable:
         if cindex is None:
             print("[glibc-parser] WARN: libclang not available, skipping AST parsing")
-            return {}
+            return SyscallTable()
+
+        aggregate = SyscallTable()
+
+        if self.max_workers <= 1 or len(files) <= 1:
+            index = cindex.Index.create()
+            for source_file in files:
+                file_results = self._parse_translation_unit(index, source_file, clang_args, target_macros)
+                aggregate.extend(file_results)
+            return aggregate
+
+        # Each worker owns its own parser + cindex.Index; results come back pickled
+        worker = partial(_parse_one, clang_args=clang_args, target_macros=target_macros)
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_parse_worker,
+            initargs=(self.glibc_root, self.target_arch, self.cache_dir),
+        ) as executor:
+            for file_results in executor.map(worker, files, chunksize=8):
+                aggregate.extend(file_results)
 
-        index = cindex.Index.create()
-        aggregate: Dict[str, List[SyscallCallInfo]] = {}
+        return aggregate
 
-        tu_options = cindex.TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD
+    @staticmethod
+    def _filter_files_by_needle(files: List[Path], needle: "re.Pattern[bytes]") -> List[Path]:
+        selected: List[Path] = []
         for source_file in files:
             try:
-                print(f"[glibc-parser] Parsing {source_file.name} with libclang...")
-                tu = index.parse(
-                    path=str(source_file),
-                    args=clang_args,
-                    options=tu_options,
-                )
-                if tu is None:
-                    print(f"[glibc-parser] WARN: Failed to create translation unit for {source_file.name}")
-                    continue
-            except Exception as e:
-                print(f"[glibc-parser] WARN: Failed to parse {source_file.name}: {e}")
-                continue
-
-            file_results = self._walk_ast(tu, source_file, target_macros)
-            if file_results:
-                print(f"[glibc-parser] Found {sum(len(v) for v in file_results.values())} syscall(s) in {source_file.name}")
-            _merge_results(aggregate, file_results)
+                with _map_source(source_file) as source:
+                    if needle.search(source):
+                        selected.append(source_file)
+            except OSError:
+                # Let libclang report unreadable files as before
+                selected.append(source_file)
+        return selected
 
-        return aggregate
+    def _parse_translation_unit(
+        self,
+        index: "cindex.Index",
+        source_file: Path,
+        clang_args: List[str],
+        target_macros: Tuple[str, ...],
+    ) -> SyscallTable:
+        """
+        단일 TU 파싱 결과. (파일 mtime/size, clang 인자, 대상 매크로)가 같으면
+        디스크 캐시에서 바로 반환하여 libclang 파싱을 생략합니다.
+        """
+        cache_key = self._source_cache_key(source_file, "tu", tuple(clang_args), target_macros)
+        if cache_key is not None:
+            cached = self._result_cache.load(cache_key)
+            if cached is not None:
+                return cached
+
+        # Token-range scanning needs no preprocessing record (PARSE_DETAILED_PROCESSING_RECORD)
+        tu_options = cindex.TranslationUnit.PARSE_NONE
+        try:
+            print(f"[glibc-parser] Parsing {source_file.name} with libclang...")
+            tu = index.parse(
+                path=str(source_file),
+                args=clang_args,
+                options=tu_options,
+            )
+            if tu is None:
+                print(f"[glibc-parser] WARN: Failed to create translation unit for {source_file.name}")
+                return SyscallTable()
+        except Exception as e:
+            print(f"[glibc-parser] WARN: Failed to parse {source_file.name}: {e}")
+            return SyscallTable()
+
+        file_results = self._walk_ast(tu, source_file, target_macros)
+        if file_results:
+            print(f"[glibc-parser] Found {len(file_results)} syscall(s) in {source_file.name}")
+        if cache_key is not None:
+            self._result_cache.store(cache_key, file_results)
+        return file_results
 
     # ------------------------------ AST Walk ------------------------------- #
     def _walk_ast(
@@ -255,138 +569,164 @@ class GlibcAstParser:
         tu: "cindex.TranslationUnit",
         source_file: Path,
         target_macros: Tuple[str, ...],
-    ) -> Dict[str, List[SyscallCallInfo]]:
-        results: Dict[str, List[SyscallCallInfo]] = {}
-        root = tu.cursor
+    ) -> SyscallTable:
+        """
+        TU 최상위의 FUNCTION_DECL 정의만 방문하고, 함수 범위의 토큰을 한 번에 읽어
+        대상 매크로 이름을 스캔합니다. 커서 단위 재귀 방문 대신 토큰 리스트를 훑으므로
+        FFI 호출 횟수가 크게 줄어듭니다.
+        """
+        results = SyscallTable()
+        macros = frozenset(target_macros)
+        function_kind = cindex.CursorKind.FUNCTION_DECL
 
-        def visit(node: "cindex.Cursor") -> None:
+        for child in tu.cursor.get_children():
             try:
-                kind = node.kind
-            except Exception:
-                return
+                kind = child.kind
+            except ValueError:
+                # Cursor kind unknown to these bindings (newer libclang)
+                continue
+            if kind is not function_kind or not child.is_definition():
+                continue
+            self._scan_function_tokens(child, results, macros)
 
-            # Macro expansion
-            if kind == cindex.CursorKind.MACRO_INSTANTIATION and node.spelling in target_macros:
-                self._process_syscall_node(node, results, origin_macro=node.spelling)
+        return results
 
-            # Direct calls
-            elif kind == cindex.CursorKind.CALL_EXPR and node.spelling in target_macros:
-                self._process_syscall_node(node, results, origin_macro=node.spelling)
+    # ------------------------- Bottom-up processing ------------------------ #
+    def _scan_function_tokens(
+        self,
+        function: "cindex.Cursor",
+        results: SyscallTable,
+        macros: frozenset,
+    ) -> None:
+        try:
+            tokens = list(function.get_tokens())
+        except Exception:
+            return
 
-            # Inline asm fallback
-            elif kind == cindex.CursorKind.ASM_STMT:
-                self._handle_inline_asm(node, results)
+        spellings = [token.spelling for token in tokens]
+        # Enclosing function is ambient state here: no per-site parent-chain walk
+        wrapper_name = function.spelling
+        # Built on the first site only; most functions have none
+        conditions: Optional[_IfConditionTable] = None
 
-            for child in node.get_children():
-                visit(child)
+        for idx, spelling in enumerate(spellings):
+            if spelling in macros:
+                close = _matching_paren_token(spellings, idx + 1)
+                if close is None:
+                    continue
+                if conditions is None:
+                    conditions = self._collect_if_conditions(function)
+                self._process_syscall_site(
+                    wrapper_name,
+                    tokens[idx],
+                    spellings[idx + 1 : close + 1],
+                    conditions,
+                    results,
+                    origin_macro=spelling,
+                )
 
-        visit(root)
-        return results
+            # Inline asm statement (not a register-variable asm label)
+            elif spelling in INLINE_ASM_KEYWORDS and (
+                idx == 0 or spellings[idx - 1] in STATEMENT_BOUNDARY_TOKENS
+            ):
+                if conditions is None:
+                    conditions = self._collect_if_conditions(function)
+                self._handle_inline_asm(wrapper_name, tokens[idx], conditions, results)
 
-    # ------------------------- Bottom-up processing ------------------------ #
-    def _process_syscall_node(
+    def _collect_if_conditions(self, function: "cindex.Cursor") -> "_IfConditionTable":
+        """
+        함수 서브트리를 한 번 순회하여 모든 IF_STMT의 범위와 조건식을 수집.
+        else 분기는 별도 범위로 나누어 부정된 조건식 "!( cond )"으로 기록합니다.
+        IF_STMT당 get_tokens()는 조건식 커서에 대해 한 번만 호출됩니다.
+        """
+        if_kind = cindex.CursorKind.IF_STMT
+        ranges: List[Tuple[int, int, str]] = []
+        for node in function.walk_preorder():
+            try:
+                if node.kind is not if_kind:
+                    continue
+            except ValueError:
+                continue
+            try:
+                # Children are (condition, then-branch[, else-branch])
+                children = list(node.get_children())
+                condition = children[0] if children else None
+                cond_text = " ".join(t.spelling for t in condition.get_tokens()) if condition else ""
+            except Exception:
+                children = []
+                cond_text = ""
+            extent = node.extent
+            start, end = extent.start.offset, extent.end.offset
+            if len(children) >= 3:
+                # Sites in the else branch run when the condition is false
+                else_start = children[2].extent.start.offset
+                negated = f"if ( !( {cond_text} ) )" if cond_text else "if (!/* condition */)"
+                ranges.append((else_start, end, negated))
+                end = else_start
+            text = f"if ( {cond_text} )" if cond_text else "if (/* condition */)"
+            ranges.append((start, end, text))
+        return _IfConditionTable(ranges)
+
+    def _process_syscall_site(
         self,
-        node: "cindex.Cursor",
-        results: Dict[str, List[SyscallCallInfo]],
+        wrapper_name: str,
+        macro_token: "cindex.Token",
+        argument_tokens: List[str],
+        conditions: "_IfConditionTable",
+        results: SyscallTable,
         origin_macro: str,
     ) -> None:
-        wrapper_name = self._trace_to_function_decl(node)
-        if not wrapper_name:
-            return
-
-        kernel_symbol, args = self._extract_call_info(node)
+        kernel_symbol, args = self._extract_call_info(argument_tokens)
         if not kernel_symbol:
             return
 
-        conditional = self._extract_conditional_context(node)
-        location = self._format_location(node.location)
+        conditional = conditions.lookup(macro_token.location.offset)
+        location = self._format_location(macro_token.location)
 
-        info = SyscallCallInfo(
+        results.append(
+            wrapper_name,
             kernel_symbol=kernel_symbol,
             raw_arguments=args,
             conditional_context=conditional,
             source_location=location,
             origin_macro=origin_macro,
         )
-        results.setdefault(wrapper_name, []).append(info)
-
-    def _trace_to_function_decl(self, node: "cindex.Cursor") -> Optional[str]:
-        cur: Optional["cindex.Cursor"] = node
-        while cur is not None:
-            if cur.kind == cindex.CursorKind.FUNCTION_DECL:
-                return cur.spelling
-            cur = cur.semantic_parent
-        return None
 
-    def _extract_call_info(self, node: "cindex.Cursor") -> Tuple[Optional[str], List[str]]:
+    def _extract_call_info(self, argument_tokens: List[str]) -> Tuple[Optional[str], List[str]]:
         """
         토큰 기반으로 매크로/호출 인자 분석:
         첫 번째 토큰 그룹에서 커널 심볼(예: __NR_openat 또는 pselect6_time64)을 추정,
         이후 인자 나열을 단순 분리.
         """
-        try:
-            tokens = list(node.get_tokens())
-        except Exception:
+        text = " ".join(argument_tokens)
+        # MACRO_NAME( kernel, nargs, arg0, ... ) and MACRO(kernel, arg0, ...) in one pass
+        m = CALL_ARGUMENTS_PATTERN.search(text)
+        if not m:
             return None, []
 
-        text = " ".join(t.spelling for t in tokens)
-        # Heuristic: MACRO_NAME( kernel, nargs, arg0, arg1, ... )
-        m = re.search(r"\(\s*([^,]+)\s*,\s*([0-9]+)\s*,(.*)\)$", text)
-        if not m:
-            # Another common pattern: MACRO(kernel, arg0, arg1, ...)
-            m2 = re.search(r"\(\s*([^,]+)\s*,(.*)\)$", text)
-            if not m2:
-                return None, []
-            kernel, rest = m2.group(1).strip(), m2.group(2)
-            args = self._split_arguments(rest)
-            return kernel, [a.strip() for a in args]
-
-        kernel = m.group(1).strip()
-        rest = m.group(3)
-        args = self._split_arguments(rest)
-        return kernel, [a.strip() for a in args]
-
-    def _extract_conditional_context(self, node: "cindex.Cursor") -> str:
-        """
-        lexical_parent 체인을 따라 가까운 IfStmt 조건식을 토큰으로 복원.
-        """
-        cur: Optional["cindex.Cursor"] = node.lexical_parent
-        while cur is not None:
-            if cur.kind == cindex.CursorKind.IF_STMT:
-                try:
-                    cond_tokens = [t.spelling for t in cur.get_tokens()]
-                    snippet = " ".join(cond_tokens)
-                    # Heuristically trim to condition parentheses if possible
-                    start = snippet.find("(")
-                    end = snippet.find(")")
-                    if start != -1 and end != -1 and end > start:
-                        return "if " + snippet[start : end + 1]
-                    return snippet[:120]
-                except Exception:
-                    return "if (/* condition */)"
-            cur = cur.lexical_parent
-        return ""
+        # _split_arguments already strips every argument
+        kernel = m.group("kernel").strip()
+        return kernel, self._split_arguments(m.group("rest"))
 
     def _handle_inline_asm(
         self,
-        node: "cindex.Cursor",
-        results: Dict[str, List[SyscallCallInfo]],
+        wrapper_name: str,
+        asm_token: "cindex.Token",
+        conditions: "_IfConditionTable",
+        results: SyscallTable,
     ) -> None:
         """
         AST로는 구체적 의미 해석이 어려운 asm에 대해 간단한 힌트만 수집.
         """
-        wrapper_name = self._trace_to_function_decl(node)
-        if not wrapper_name:
-            return
-        location = self._format_location(node.location)
-        info = SyscallCallInfo(
+        location = self._format_location(asm_token.location)
+        results.append(
+            wrapper_name,
             kernel_symbol="asm(syscall)",
-            raw_arguments=[],
-            conditional_context=self._extract_conditional_context(node),
+            raw_arguments=(),
+            conditional_context=conditions.lookup(asm_token.location.offset),
             source_location=location,
             origin_macro="asm",
         )
-        results.setdefault(wrapper_name, []).append(info)
 
     # ----------------------------- Text fallback --------------------------- #
     def _extract_syscall_info_text(
@@ -394,30 +734,67 @@ class GlibcAstParser:
         symbol: str,
         source_path: Path,
     ) -> Optional[SyscallExtractionResult]:
-        source = source_path.read_text(encoding="utf-8", errors="ignore")
+        """
+        파일 stat 기반 키로 디스크 캐시를 먼저 조회하고, 없으면 파일을 읽어 추출합니다.
+        """
+        cache_key = self._source_cache_key(source_path, "text", symbol)
+        if cache_key is not None:
+            cached = self._result_cache.load(cache_key)
+            if cached is not None:
+                # Stored as a 1-tuple so that a cached "no result" is distinguishable from a miss
+                return cached[0]
+
+        result = self._extract_syscall_info_text_uncached(symbol, source_path)
+        if cache_key is not None:
+            self._result_cache.store(cache_key, (result,))
+        return result
+
+    def _extract_syscall_info_text_uncached(
+        self,
+        symbol: str,
+        source_path: Path,
+    ) -> Optional[SyscallExtractionResult]:
+        # Large files are scanned through a read-only mapping instead of a bytes copy
+        if source_path.stat().st_size >= MMAP_READ_THRESHOLD:
+            with _map_source(source_path) as mapping:
+                return self._extract_syscall_info_from_source(symbol, source_path, mapping)
+        return self._extract_syscall_info_from_source(symbol, source_path, source_path.read_bytes())
+
+    def _extract_syscall_info_from_source(
+        self,
+        symbol: str,
+        source_path: Path,
+        source: Any,
+    ) -> Optional[SyscallExtractionResult]:
+        """
+        source는 bytes 또는 mmap (bytes 호환 버퍼). 반환값에는 잘라낸 bytes 조각만 담깁니다.
+        """
+        # Literal prefilter: bytes.find is far cheaper than slicing + the alternation search.
+        # (find, not "in": mmap has no substring containment.)
+        if not any(source.find(literal) != -1 for literal in SYS_CALL_MACRO_LITERALS):
+            print(f"[glibc-parser] DEBUG: No syscall macro literal in {source_path.name}")
+            return None
 
         signature, body = self._slice_function_block(source, symbol)
         if signature is None or body is None:
             print(f"[glibc-parser] DEBUG: Failed to extract function block for `{symbol}`")
-            # Try searching for any syscall macro in the entire file as fallback
-            macro_match = SYS_CALL_MACRO_PATTERN.search(source)
-            if macro_match:
+            # Debug-only whole-file search; skipped for mmap sources, whose engines would need a full copy
+            if isinstance(source, bytes) and self._find_syscall_macro(source):
                 print(f"[glibc-parser] DEBUG: Found macro in file but couldn't extract function block")
             return None
 
-        print(f"[glibc-parser] DEBUG: Extracted function body (length: {len(body)} chars)")
+        print(f"[glibc-parser] DEBUG: Extracted function body (length: {len(body)} bytes)")
 
-        macro_match = SYS_CALL_MACRO_PATTERN.search(body)
+        macro_match = self._find_syscall_macro(body)
         if not macro_match:
             print(f"[glibc-parser] DEBUG: No syscall macro found in function body")
             # Debug: show first 500 chars of body
-            preview = body[:500].replace('\n', '\\n')
+            preview = body[:500].decode("utf-8", errors="ignore").replace('\n', '\\n')
             print(f"[glibc-parser] DEBUG: Function body preview: {preview}...")
             return None
 
-        macro_name = macro_match.group(1)
+        macro_name, macro_start = macro_match
         print(f"[glibc-parser] DEBUG: Found macro: {macro_name}")
-        macro_start = macro_match.end()
         macro_call, arguments = self._extract_macro_arguments_text(body, macro_start)
         if macro_call is None or not arguments:
             print(f"[glibc-parser] DEBUG: Failed to extract macro arguments")
@@ -440,94 +817,108 @@ class GlibcAstParser:
             macro_name=macro_name,
             kernel_symbol=kernel_symbol,
             raw_arguments=syscall_args,
-            function_signature=signature.strip(),
+            function_signature=signature.decode("utf-8", errors="ignore").strip(),
         )
 
+    def _find_syscall_macro(self, text: bytes) -> Optional[Tuple[str, int]]:
+        """
+        가장 왼쪽의 syscall 매크로 호출을 찾아 (매크로 이름, 여는 괄호 직후 offset)을 반환.
+        hyperscan DB -> RE2 패턴 -> 정규식(긴 본문은 리터럴 앵커 스캔 _search_macro_literals) 순으로 엔진을 선택.
+        text는 함수 본문 등 bytes 조각이어야 합니다 (mmap 전체를 넘기지 마세요).
+        """
+        if self._macro_db is None:
+            if _RE2_MACRO_PATTERN is not None:
+                match = _RE2_MACRO_PATTERN.search(text)
+            elif len(text) >= MACRO_LITERAL_SEARCH_MIN_LENGTH:
+                match = _search_macro_literals(text)
+            else:
+                match = SYS_CALL_MACRO_PATTERN.search(text)
+            if not match:
+                return None
+            return match.group(1).decode("ascii"), match.end()
+
+        hits: List[Tuple[int, int]] = []
+
+        def on_match(_id: int, start: int, end: int, _flags: int, _context: Any) -> bool:
+            # Matches arrive in end order. No alternative is a suffix of another, and each ends at
+            # its own "(", so the first hit is also the leftmost; stop the scan there.
+            hits.append((start, end))
+            return True
+
+        try:
+            self._macro_db.scan(text, match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+        if not hits:
+            return None
+        start, end = hits[0]
+        macro_name = text[start:end].rstrip(b"( \t\r\n\f\v").decode("ascii")
+        return macro_name, end
+
     @staticmethod
     def _slice_function_block(
-        source: str,
+        source: bytes,
         symbol: str,
-    ) -> Tuple[Optional[str], Optional[str]]:
-        # Try multiple patterns: open, __open, __open64, etc.
-        # Order matters: try more specific patterns first
-        patterns = [
-            # Function definitions at start of line (most common)
-            (rf"^[^\n]*\b{re.escape(symbol)}\s*\(", re.MULTILINE),
-            (rf"^[^\n]*\b__{re.escape(symbol)}\s*\(", re.MULTILINE),
-            (rf"^[^\n]*\b__{re.escape(symbol)}64\s*\(", re.MULTILINE),
-            # Anywhere in the file (fallback)
-            (rf"\b{re.escape(symbol)}\s*\(", 0),
-            (rf"\b__{re.escape(symbol)}\s*\(", 0),
-        ]
-
-        for pattern, flags in patterns:
-            matches = list(re.finditer(pattern, source, flags))
-            for match in matches:
-                pos = match.start()
-                
-                # Find the opening brace after the function name
-                # Search from the end of the match (after the opening paren)
-                search_start = match.end()
-                brace_start = source.find("{", search_start)
-                if brace_start == -1:
-                    continue
-                
-                # Verify this looks like a function definition
-                # Check if there's a closing paren before the brace (function signature)
-                paren_end = source.rfind(")", search_start, brace_start)
-                if paren_end == -1:
-                    continue
-                
-                # Look backwards for function-like context
-                # Accept if there's whitespace/newline before (likely a definition)
-                before_pos = max(0, pos - 100)
-                context = source[before_pos:pos]
-                # Skip if it's clearly a function call (has something like "function(" before)
-                if re.search(r'[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*$', context):
-                    continue
+    ) -> Tuple[Optional[bytes], Optional[bytes]]:
+        anchors = _definition_anchors(source, symbol)
+        if not anchors[0] and not anchors[1]:
+            return None, None
+        # Offsets of every line start, shared by candidate ordering and signature slicing
+        line_starts = _line_starts(source)
+
+        for pos, search_start in _definition_candidates(anchors, line_starts):
+            # Find the opening brace after the function name
+            # Search from the end of the match (after the opening paren)
+            brace_start = source.find(b"{", search_start)
+            if brace_start == -1:
+                continue
+            
+            # Verify this looks like a function definition
+            # Check if there's a closing paren before the brace (function signature)
+            paren_end = source.rfind(b")", search_start, brace_start)
+            if paren_end == -1:
+                continue
+            
+            # Look backwards for function-like context
+            # Accept if there's whitespace/newline before (likely a definition)
+            before_pos = max(0, pos - 100)
+            context = source[before_pos:pos].rstrip()
+            # Skip if it's clearly a function call (has something like "function(" before);
+            # only contexts ending in ")" can match, so the regex runs on those alone
+            if context.endswith(b")") and PRECEDING_CALL_PATTERN.search(context):
+                continue
 
-                # Extract signature (from start of line or reasonable point before)
-                header_start = source.rfind("\n", 0, pos)
-                header_start = 0 if header_start == -1 else header_start
-                
-                # Get signature up to the brace
-                sig_start = max(header_start, brace_start - 1000)  # Allow longer signatures
-                signature = source[sig_start:brace_start].strip()
-                
-                # Extract function body
-                body, _ = GlibcAstParser._collect_brace_block(source, brace_start)
-                if body is None:
-                    continue
+            # Extract signature (from start of line or reasonable point before)
+            line_start = line_starts[bisect.bisect_right(line_starts, pos) - 1]
+            header_start = max(line_start - 1, 0)
+            
+            # Get signature up to the brace
+            sig_start = max(header_start, brace_start - 1000)  # Allow longer signatures
+            signature = source[sig_start:brace_start].strip()
+            
+            # Extract function body
+            body, _ = GlibcAstParser._collect_brace_block(source, brace_start)
+            if body is None:
+                continue
 
-                # Verify body is not empty and contains something useful
-                if len(body.strip()) < 10:
-                    continue
+            # Verify body is not empty and contains something useful
+            if len(body.strip()) < 10:
+                continue
 
-                return signature, body
+            return signature, body
 
         return None, None
 
     @staticmethod
-    def _collect_brace_block(source: str, brace_index: int) -> Tuple[Optional[str], int]:
-        depth = 0
-        idx = brace_index
-        while idx < len(source):
-            char = source[idx]
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    return source[brace_index : idx + 1], idx
-            idx += 1
-        return None, idx
+    def _collect_brace_block(source: bytes, brace_index: int) -> Tuple[Optional[bytes], int]:
+        return _collect_balanced_block(source, brace_index, b"{", b"}")
 
     def _extract_macro_arguments_text(
         self,
-        body: str,
+        body: bytes,
         macro_start: int,
-    ) -> Tuple[Optional[str], Optional[List[str]]]:
-        opening = body.find("(", macro_start - 1)
+    ) -> Tuple[Optional[bytes], Optional[List[str]]]:
+        opening = body.find(b"(", macro_start - 1)
         if opening == -1:
             return None, None
 
@@ -535,49 +926,46 @@ class GlibcAstParser:
         if args_block is None:
             return None, None
 
-        arguments = self._split_arguments(args_block[1:-1])
+        arguments = self._split_arguments(args_block[1:-1].decode("utf-8", errors="ignore"))
         return args_block, arguments
 
     @staticmethod
     def _collect_parentheses_block(
-        text: str,
+        text: bytes,
         open_index: int,
-    ) -> Tuple[Optional[str], int]:
-        depth = 0
-        idx = open_index
-        while idx < len(text):
-            char = text[idx]
-            if char == "(":
-                depth += 1
-            elif char == ")":
-                depth -= 1
-                if depth == 0:
-                    return text[open_index : idx + 1], idx
-            idx += 1
-        return None, idx
+    ) -> Tuple[Optional[bytes], int]:
+        return _collect_balanced_block(text, open_index, b"(", b")")
 
     @staticmethod
     def _split_arguments(argument_block: str) -> List[str]:
+        """
+        최상위(depth 0) 콤마 기준으로 인자를 분리.
+        구분자 위치만 finditer로 건너뛰며 처리하므로 일반 문자는 C 레벨에서 스캔됩니다.
+        _scan 확장이 빌드되어 있으면 그쪽 구현을, 아니면 긴 ASCII 블록은 NumPy 구현을 사용합니다.
+        """
+        if _scan is not None:
+            return _scan.split_arguments(argument_block)
+        if np is not None and len(argument_block) >= NUMPY_SPLIT_MIN_LENGTH and argument_block.isascii():
+            return _split_arguments_numpy(argument_block)
+
         arguments: List[str] = []
         depth = 0
-        current: List[str] = []
-
-        for char in argument_block:
-            if char == "," and depth == 0:
-                argument = "".join(current).strip()
-                if argument:
-                    arguments.append(argument)
-                current = []
-                continue
+        start = 0
 
-            if char in ("(", "{", "["):
+        for match in ARGUMENT_DELIMITER_PATTERN.finditer(argument_block):
+            char = match.group()
+            if char == ",":
+                if depth == 0:
+                    argument = argument_block[start : match.start()].strip()
+                    if argument:
+                        arguments.append(argument)
+                    start = match.end()
+            elif char in "({[":
                 depth += 1
-            elif char in (")", "}", "]"):
+            else:
                 depth -= 1
 
-            current.append(char)
-
-        trailing = "".join(current).strip()
+        trailing = argument_block[start:].strip()
         if trailing:
             arguments.append(trailing)
 
@@ -586,16 +974,57 @@ class GlibcAstParser:
     # ------------------------------ Utilities ------------------------------ #
     @lru_cache(maxsize=256)
     def _search_globally(self, symbol: str) -> Optional[Path]:
-        pattern = re.compile(rf"\b{re.escape(symbol)}\b", re.MULTILINE)
-        for source_path in self.glibc_root.rglob("*.c"):
+        pattern = re.compile(rb"\b" + re.escape(symbol.encode()) + rb"\b")
+        for source_path in self._discover_source_files():
             try:
-                snippet = source_path.open(encoding="utf-8", errors="ignore").read()
+                with _map_source(source_path) as source:
+                    if pattern.search(source):
+                        return source_path
             except OSError:
                 continue
-            if pattern.search(snippet):
-                return source_path
         return None
 
+    def _build_symbol_index(self) -> Dict[bytes, List[Path]]:
+        """
+        모든 .c 파일을 한 번 순회하여 identifier -> 파일 목록 역색인을 생성.
+        (path, mtime, size) 목록의 해시를 키로 디스크에 저장하여 다음 실행에서 재사용합니다.
+        """
+        if self._symbol_to_files is not None:
+            return self._symbol_to_files
+
+        files = self._discover_source_files()
+        fingerprint: List[Tuple[str, int, int]] = []
+        for source_path in files:
+            try:
+                stat = source_path.stat()
+            except OSError:
+                continue
+            fingerprint.append((str(source_path), stat.st_mtime_ns, stat.st_size))
+
+        store = self._index_cache
+        key = digest_key((RESULT_CACHE_VERSION, fingerprint))
+        self._symbol_index_key = key
+        cached = store.load(key)
+        if cached is not None:
+            self._symbol_to_files = cached
+            return cached
+
+        print(f"[glibc-parser] Building symbol index over {len(files)} source file(s)...")
+        index: Dict[bytes, List[Path]] = defaultdict(list)
+        for source_path in files:
+            try:
+                with _map_source(source_path) as source:
+                    identifiers = set(IDENTIFIER_PATTERN.findall(source))
+            except OSError:
+                continue
+            for identifier in identifiers:
+                index[identifier].append(source_path)
+
+        self._symbol_to_files = dict(index)
+        store.store(key, self._symbol_to_files)
+        return self._symbol_to_files
+
+    @lru_cache(maxsize=256)
     def _locate_symbol_source(self, symbol: str) -> Optional[Path]:
         explicit = [
             self.glibc_root / f"{symbol}.c",
@@ -605,7 +1034,89 @@ class GlibcAstParser:
         for candidate in explicit:
             if candidate.exists():
                 return candidate
-        return self._search_globally(symbol)
+
+        # The index only records identifiers of 3+ characters
+        if IDENTIFIER_PATTERN.fullmatch(symbol.encode()) is None:
+            return self._search_globally(symbol)
+        candidates = self._build_symbol_index().get(symbol.encode())
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+
+        # The pick only changes when some indexed file does, so it is keyed by the index digest.
+        # Without libclang the pick can fall back to candidates[0]; keep it apart from libclang picks
+        pick_key = digest_key(
+            (RESULT_CACHE_VERSION, self._symbol_index_key, "defining_file", symbol, self.target_arch, cindex is not None)
+        )
+        cached = self._index_cache.load(pick_key)
+        if cached is not None:
+            return cached
+        chosen = self._pick_defining_file(symbol, candidates)
+        self._index_cache.store(pick_key, chosen)
+        return chosen
+
+    def _pick_defining_file(self, symbol: str, candidates: List[Path]) -> Path:
+        """
+        심볼을 언급하는 파일 중 실제로 symbol/__symbol 함수를 정의하는 파일을 우선 선택.
+        먼저 bytes 검사(_has_definition_anchor)로 후보를 훑고, 어느 파일도 확정되지 않을 때만
+        함수 본문을 건너뛰는 시그니처 전용 파싱(SKIP_FUNCTION_BODIES | INCOMPLETE)을 사용합니다.
+        """
+        for candidate in candidates:
+            try:
+                with _map_source(candidate) as source:
+                    if _has_definition_anchor(source, symbol):
+                        return candidate
+            except OSError:
+                continue
+
+        if cindex is None:
+            return candidates[0]
+
+        names = {symbol, f"__{symbol}", f"__{symbol}64"}
+        index = cindex.Index.create()
+        clang_args = self._build_default_clang_args()
+        for candidate in candidates[:MAX_SIGNATURE_CANDIDATES]:
+            if names & self._defined_functions(index, candidate, clang_args):
+                return candidate
+        return candidates[0]
+
+    @staticmethod
+    def _defined_functions(
+        index: "cindex.Index",
+        source_file: Path,
+        clang_args: List[str],
+    ) -> set:
+        options = (
+            cindex.TranslationUnit.PARSE_SKIP_FUNCTION_BODIES
+            | cindex.TranslationUnit.PARSE_INCOMPLETE
+        )
+        try:
+            tu = index.parse(path=str(source_file), args=clang_args, options=options)
+            with _map_source(source_file) as source:
+                defined = set()
+                for child in tu.cursor.get_children():
+                    if child.kind != cindex.CursorKind.FUNCTION_DECL:
+                        continue
+                    location = child.location
+                    if location.file is None or location.file.name != str(source_file):
+                        continue
+                    # Skipped bodies are not reported as definitions; look for the "{" instead
+                    end = child.extent.end.offset
+                    if source[end : end + 256].lstrip().startswith(b"{"):
+                        defined.add(child.spelling)
+                return defined
+        except Exception as error:
+            print(f"[glibc-parser] WARN: Signature pass failed for {source_file.name}: {error}")
+            return set()
+
+    @staticmethod
+    def _source_cache_key(source_path: Path, *parts: Any) -> Optional[str]:
+        try:
+            stat = source_path.stat()
+        except OSError:
+            return None
+        return digest_key((RESULT_CACHE_VERSION, str(source_path), stat.st_mtime_ns, stat.st_size) + parts)
 
     @staticmethod
     def _format_location(location: "cindex.SourceLocation") -> str:
@@ -616,10 +1127,353 @@ class GlibcAstParser:
             return "<unknown>:0"
 
 
-def _merge_results(
-    base: Dict[str, List[SyscallCallInfo]],
-    incoming: Dict[str, List[SyscallCallInfo]],
-) -> None:
-    for key, value in incoming.items():
-        base.setdefault(key, []).extend(value)
+# Per-process state for the _parsing_loop worker pool
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_parse_worker(glibc_root: Path, target_arch: str, cache_dir: Path) -> None:
+    _WORKER_STATE["parser"] = GlibcAstParser(
+        glibc_root=glibc_root,
+        target_arch=target_arch,
+        cache_dir=cache_dir,
+        max_workers=1,
+    )
+    if cindex is not None:
+        _WORKER_STATE["index"] = cindex.Index.create()
+
+
+def _parse_one(
+    source_file: Path,
+    clang_args: List[str],
+    target_macros: Tuple[str, ...],
+) -> SyscallTable:
+    parser: GlibcAstParser = _WORKER_STATE["parser"]
+    return parser._parse_translation_unit(_WORKER_STATE["index"], source_file, clang_args, target_macros)
+
+
+def _parse_wrapper_one(target: Tuple[str, Optional[Path]]) -> Dict[str, Any]:
+    parser: GlibcAstParser = _WORKER_STATE["parser"]
+    return parser.parse_wrapper_function(*target)
+
+
+def _args_mapping_json(arguments: Sequence[str]) -> str:
+    """
+    인자 목록을 args_mapping_json 문자열로 직렬화 (인자는 생성 시점에 이미 strip된 상태).
+    스키마가 고정이므로 dict 목록을 만들지 않고 문자열 값만 인코딩해 직접 이어 붙입니다.
+    orjson이 있으면 C 구현으로 인코딩합니다 (구분자 공백이 없는 compact 형식).
+    """
+    if orjson is not None:
+        return (
+            b"["
+            + b",".join(b'{"strategy":"raw","value":' + orjson.dumps(argument) + b"}" for argument in arguments)
+            + b"]"
+        ).decode("utf-8")
+    # Same separators as json.dumps(mapping, ensure_ascii=False)
+    return (
+        "["
+        + ", ".join('{"strategy": "raw", "value": ' + json.dumps(argument, ensure_ascii=False) + "}" for argument in arguments)
+        + "]"
+    )
+
+
+def _collect_balanced_block(
+    text: bytes,
+    open_index: int,
+    opener: bytes,
+    closer: bytes,
+) -> Tuple[Optional[bytes], int]:
+    """
+    text[open_index]의 opener와 짝이 맞는 closer까지의 블록을 반환 (실패 시 None, len(text)).
+    문자 단위 루프 대신 bytes.find로 다음 괄호 위치까지 건너뛰므로 반복 횟수는 괄호 수에 비례합니다.
+    _scan 확장이 빌드되어 있으면 한 번의 C 루프로 처리합니다.
+    """
+    if _scan is not None:
+        close = _scan.find_matching(text, open_index, opener[0], closer[0])
+        if close == -1:
+            return None, len(text)
+        return text[open_index : close + 1], close
+
+    depth = 1
+    idx = open_index + 1
+    close = text.find(closer, idx)
+    while close != -1:
+        # Nested opener before the next closer?
+        opening = text.find(opener, idx, close)
+        if opening != -1:
+            depth += 1
+            idx = opening + 1
+            continue
+        depth -= 1
+        if depth == 0:
+            return text[open_index : close + 1], close
+        idx = close + 1
+        close = text.find(closer, idx)
+    return None, len(text)
+
+
+def _split_arguments_numpy(argument_block: str) -> List[str]:
+    """
+    GlibcAstParser._split_arguments의 NumPy 버전: 괄호 depth를 누적합으로 구해
+    depth 0인 콤마 위치를 한 번에 찾습니다 (ASCII 블록 전용).
+    """
+    codes = np.frombuffer(argument_block.encode("ascii"), dtype=np.uint8)
+    # Plain == masks: np.isin sorts its inputs and dominates the cost at these sizes
+    opens = (codes == 40) | (codes == 91) | (codes == 123)  # ( [ {
+    closes = (codes == 41) | (codes == 93) | (codes == 125)  # ) ] }
+    depth = np.cumsum(opens, dtype=np.int32) - np.cumsum(closes, dtype=np.int32)
+    commas = np.flatnonzero((codes == 44) & (depth == 0))
+
+    arguments: List[str] = []
+    start = 0
+    for comma in commas.tolist():
+        argument = argument_block[start:comma].strip()
+        if argument:
+            arguments.append(argument)
+        start = comma + 1
+
+    trailing = argument_block[start:].strip()
+    if trailing:
+        arguments.append(trailing)
+    return arguments
+
+
+def _search_macro_literals(text: bytes) -> Optional["re.Match[bytes]"]:
+    """
+    SYS_CALL_MACRO_PATTERN.search(text)와 같은 결과를 리터럴 bytes.find로 구합니다.
+    모든 alternative는 SYS_CALL_MACRO_LITERALS 중 하나로 시작하므로, 각 리터럴의 등장 위치에서만
+    패턴을 anchored match하고 가장 왼쪽 결과를 고릅니다.
+    """
+    best: Optional["re.Match[bytes]"] = None
+    for literal in SYS_CALL_MACRO_LITERALS:
+        # Only occurrences starting left of the current best can improve on it
+        limit = len(text) if best is None else best.start() + len(literal) - 1
+        index = text.find(literal, 0, limit)
+        while index != -1:
+            match = SYS_CALL_MACRO_PATTERN.match(text, index)
+            if match:
+                best = match
+                break
+            index = text.find(literal, index + 1, limit)
+    return best
+
+
+def _definition_anchors(
+    source: bytes,
+    symbol: str,
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    symbol 리터럴을 bytes.find 한 번의 순회로 찾아 정의 후보 앵커를 수집.
+    반환: ("(__)symbol(" 목록, "__symbol64(" 목록), 각 원소는 (시작 offset, 여는 괄호 직후 offset).
+    """
+    needle = symbol.encode()
+    plain: List[Tuple[int, int]] = []
+    wide: List[Tuple[int, int]] = []
+    index = source.find(needle)
+    while index != -1:
+        tail = index + len(needle)
+        # A word-bounded "__" prefix belongs to the anchor (leftmost start wins)
+        prefixed = index >= 2 and source[index - 2:index] == b"__" and _word_boundary(source, index - 2)
+        match = OPEN_PAREN_PATTERN.match(source, tail)
+        if match:
+            if prefixed:
+                plain.append((index - 2, match.end()))
+            elif _word_boundary(source, index):
+                plain.append((index, match.end()))
+        if prefixed and source[tail:tail + 2] == b"64":
+            match = OPEN_PAREN_PATTERN.match(source, tail + 2)
+            if match:
+                wide.append((index - 2, match.end()))
+        index = source.find(needle, index + 1)
+
+    plain.sort()
+    return plain, wide
+
+
+def _has_definition_anchor(source: bytes, symbol: str) -> bool:
+    """
+    (__)symbol( 또는 __symbol64( 가 함수 정의처럼 보이는지 bytes만으로 판정:
+    들여쓰기/전처리 지시문/식 문맥이 아닌 줄에서 시작하고, 짝이 맞는 ")" 뒤가 바로 "{".
+    ")"과 "{" 사이에 속성 매크로 등이 있으면 False (libclang 판정으로 넘어감).
+    """
+    plain, wide = _definition_anchors(source, symbol)
+    for start, paren_end in plain + wide:
+        line_start = source.rfind(b"\n", 0, start) + 1
+        prefix = source[line_start:start]
+        # Calls sit indented inside bodies; definitions start their line with the type or the name
+        if prefix and (prefix[0] in b" \t#" or any(char in prefix for char in b"(=;,")):
+            continue
+        block, close = _collect_balanced_block(source, paren_end - 1, b"(", b")")
+        if block is None:
+            continue
+        if source[close + 1 : close + 257].lstrip().startswith(b"{"):
+            return True
+    return False
+
+
+def _definition_candidates(
+    anchors: Tuple[List[Tuple[int, int]], List[Tuple[int, int]]],
+    line_starts: List[int],
+) -> Iterator[Tuple[int, int]]:
+    """
+    _slice_function_block이 검사할 (pos, 여는 괄호 직후 offset) 후보를 우선순위 순으로 생성.
+    Order matters: line-anchored (__)symbol(, line-anchored __symbol64(, then anywhere in the file.
+    """
+    plain, wide = anchors
+    for group in (plain, wide):
+        yield from _line_anchored_candidates(group, line_starts)
+
+    # Anywhere in the file (fallback): leftmost non-overlapping anchors
+    next_allowed = 0
+    for start, end in plain:
+        if start >= next_allowed:
+            yield start, end
+            next_allowed = end
+
+
+def _line_anchored_candidates(
+    group: List[Tuple[int, int]],
+    line_starts: List[int],
+) -> Iterator[Tuple[int, int]]:
+    # One candidate per line: the line start plus the end of its rightmost anchor
+    per_line: List[Tuple[int, int]] = []
+    for start, end in group:
+        line_start = line_starts[bisect.bisect_right(line_starts, start) - 1]
+        if per_line and per_line[-1][0] == line_start:
+            per_line[-1] = (line_start, end)
+        else:
+            per_line.append((line_start, end))
+
+    next_allowed = 0
+    for line_start, end in per_line:
+        if line_start >= next_allowed:
+            yield line_start, end
+            next_allowed = end
+
+
+def _word_boundary(source: bytes, index: int) -> bool:
+    """index 위치의 identifier 문자 앞이 \b인지 (bytes 패턴과 같은 ASCII 기준)."""
+    return index == 0 or source[index - 1] not in IDENTIFIER_BYTES
+
+
+@lru_cache(maxsize=16)
+def _macro_needle(target_macros: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    """대상 매크로 이름이나 inline asm 키워드 중 하나라도 토큰으로 등장하는지 검사하는 bytes 패턴."""
+    # _scan_function_tokens also reports asm statements, so those files must survive the prefilter
+    names = tuple(target_macros) + tuple(sorted(INLINE_ASM_KEYWORDS))
+    alternatives = b"|".join(re.escape(name.encode()) for name in names)
+    return re.compile(rb"\b(?:" + alternatives + rb")\b")
+
+
+def _matching_paren_token(spellings: List[str], open_idx: int) -> Optional[int]:
+    """spellings[open_idx]의 "("와 짝이 맞는 ")" 토큰 인덱스 (없으면 None)."""
+    if open_idx >= len(spellings) or spellings[open_idx] != "(":
+        return None
+    depth = 0
+    for idx in range(open_idx, len(spellings)):
+        spelling = spellings[idx]
+        if spelling == "(":
+            depth += 1
+        elif spelling == ")":
+            depth -= 1
+            if depth == 0:
+                return idx
+    return None
+
+
+def _line_starts(source: bytes) -> List[int]:
+    starts = [0]
+    newline = source.find(b"\n")
+    while newline != -1:
+        starts.append(newline + 1)
+        newline = source.find(b"\n", newline + 1)
+    return starts
+
+
+def _iter_c_files(root: Path) -> Iterator[Path]:
+    """
+    os.scandir 기반 반복 순회로 root 아래의 .c 파일을 생성.
+    SKIPPED_SOURCE_DIRS에 해당하는 디렉터리는 내려가지 않습니다.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs: List[Path] = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIPPED_SOURCE_DIRS:
+                            subdirs.append(Path(entry.path))
+                    elif entry.name.endswith(".c") and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+        # Keep a depth-first, in-directory order like rglob
+        pending.extend(reversed(subdirs))
+
+
+@contextmanager
+def _map_source(path: Path) -> Iterator[Any]:
+    """
+    파일을 읽기 전용 mmap으로 열어 bytes 호환 버퍼를 제공 (빈 파일은 b"").
+    모든 호출자가 앞에서부터 훑으므로 순차 접근 힌트를 주고, 블록을 벗어나면 매핑을 즉시 해제합니다.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            yield b""
+            return
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    try:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapping.madvise(mmap.MADV_SEQUENTIAL)
+        yield mapping
+    finally:
+        mapping.close()
+
+
+def _build_macro_database() -> Optional["hyperscan.Database"]:
+    """
+    SYS_CALL_MACRO_ALTERNATIVES를 하나의 hyperscan DB로 컴파일.
+    hyperscan이 없거나 컴파일에 실패하면 None (re 기반 탐색으로 대체).
+    """
+    if hyperscan is None:
+        return None
+
+    expressions = [alternative + rb"\s*\(" for alternative in SYS_CALL_MACRO_ALTERNATIVES]
+    flags = [hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions)
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=flags,
+        )
+    except Exception as exc:  # pragma: no cover
+        print(f"[glibc-parser] WARN: Failed to compile hyperscan database: {exc}")
+        return None
+    return database
+
+
+def _compile_re2_macro_pattern() -> Optional["re2._Regexp"]:
+    """
+    SYS_CALL_MACRO_PATTERN과 같은 alternation을 RE2(DFA)로 컴파일.
+    google-re2가 없거나 컴파일에 실패하면 None.
+    """
+    if re2 is None:
+        return None
+
+    try:
+        return re2.compile(rb"(" + rb"|".join(SYS_CALL_MACRO_ALTERNATIVES) + rb")\s*\(")
+    except Exception as exc:  # pragma: no cover
+        print(f"[glibc-parser] WARN: Failed to compile RE2 macro pattern: {exc}")
+        return None
+
 
+# Second-tier engine for _find_syscall_macro when no hyperscan database is available
+_RE2_MACRO_PATTERN = _compile_re2_macro_pattern()
@@ -0,0 +1,87 @@
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+try:
+    from blake3 import blake3
+except ImportError:  # pragma: no cover - optional dependency guard
+    blake3 = None  # type: ignore[misc]
+
+
+def default_cache_dir() -> Path:
+    """Resolve the on-disk cache location (GLIBC_PARSER_CACHE_DIR or ~/.cache/glibc_parser)."""
+    configured = os.getenv("GLIBC_PARSER_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "glibc_parser"
+
+
+def digest_key(parts: Iterable[Any]) -> str:
+    """Build a stable hex key from the repr of every part."""
+    hasher = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        hasher.update(repr(part).encode("utf-8", errors="surrogateescape"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """
+    Hex digest of a file's contents (independent of path and mtime).
+
+    Uses BLAKE3 over a read-only mapping when the blake3 package is installed,
+    chunked blake2b otherwise. The two produce different digest lengths, so keys
+    from either never collide.
+    """
+    with path.open("rb") as source:
+        if blake3 is not None:
+            hasher = blake3(max_threads=blake3.AUTO)
+            if os.fstat(source.fileno()).st_size:
+                with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                    hasher.update(mapping)
+            return hasher.hexdigest()
+
+        fallback = hashlib.blake2b(digest_size=20)
+        for chunk in iter(lambda: source.read(1 << 20), b""):
+            fallback.update(chunk)
+        return fallback.hexdigest()
+
+
+class DiskCache:
+    """
+    Pickle-backed key/value store under a single directory.
+
+    Reads that fail for any reason are treated as misses; writes are atomic
+    (temp file + os.replace) so concurrent runs never observe partial blobs.
+    """
+
+    def __init__(self, cache_dir: Path, namespace: str) -> None:
+        self.directory = cache_dir / namespace
+
+    def load(self, key: str) -> Optional[Any]:
+        try:
+            with (self.directory / f"{key}.pickle").open("rb") as blob:
+                return pickle.load(blob)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            print(f"[glibc-parser] WARN: Ignoring unreadable cache entry {key}: {exc}")
+            return None
+
+    def store(self, key: str, value: Any) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as blob:
+                    pickle.dump(value, blob, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.directory / f"{key}.pickle")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as exc:
+            print(f"[glibc-parser] WARN: Failed to write cache entry {key}: {exc}")
@@ -1,8 +1,9 @@
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from .ast_parser import GlibcAstParser
+from .cache_helper import default_cache_dir
 from .redis_helper import RedisClient
 
 
@@ -12,9 +13,16 @@ def load_environment() -> Dict[str, Any]:
         "glibc_version": os.getenv("GLIBC_VERSION", "2.35"),
         "target_arch": os.getenv("TARGET_ARCH", "x86_64"),
         "workspace_dir": Path(os.getenv("WORKSPACE_DIR", "workspace")).resolve(),
+        "cache_dir": default_cache_dir().resolve(),
+        "target_symbols": tuple(
+            symbol.strip() for symbol in os.getenv("TARGET_SYMBOLS", "open").split(",") if symbol.strip()
+        ),
+        "parse_workers": int(os.getenv("PARSE_WORKERS", str(os.cpu_count() or 1))),
         "redis_host": os.getenv("REDIS_HOST", "localhost"),
         "redis_port": int(os.getenv("REDIS_PORT", "6379")),
         "redis_password": os.getenv("REDIS_PASSWORD", ""),
+        "redis_batch_size": int(os.getenv("REDIS_BATCH_SIZE", "100")),
+        "redis_cache_ttl": int(os.getenv("REDIS_CACHE_TTL", str(7 * 24 * 3600))),
     }
 
 
@@ -83,20 +91,43 @@ def main() -> None:
     parser = GlibcAstParser(
         glibc_root=workspace_root,
         target_arch=config["target_arch"],
+        cache_dir=config["cache_dir"],
     )
 
-    parse_result = parser.parse_wrapper_function("open")
-    status = parse_result.get("status")
-
-    if status != "parsed":
-        print(
-            "[glibc-parser] WARN: Parsing did not succeed. "
-            f"status={status} message={parse_result.get('message', '')}"
-        )
-        if 'source_path' in parse_result:	
-            print(f" - Analyzed File: {parse_result['source_path']}")
-    else:
-        redis_client.store_syscall_mapping("open", parse_result)
+    # Collect every parsed wrapper first so Redis sees batched pipelines instead of one write each
+    parsed: List[Tuple[str, Dict[str, Any]]] = []
+    pending: List[Tuple[str, Optional[str]]] = []
+    for symbol in config["target_symbols"]:
+        # Results keyed by source content hash survive across pods; a hit skips parsing entirely
+        fingerprint = parser.result_fingerprint(symbol)
+        cached = redis_client.get_cached(fingerprint) if fingerprint else None
+        if cached is not None:
+            print(f"[glibc-parser] Using cached parse result for `{symbol}`")
+            parsed.append((symbol, cached))
+            continue
+        pending.append((symbol, fingerprint))
+
+    parse_results = parser.parse_wrapper_functions(
+        [symbol for symbol, _ in pending],
+        max_workers=config["parse_workers"],
+    )
+    for (symbol, fingerprint), parse_result in zip(pending, parse_results):
+        status = parse_result.get("status")
+
+        if status != "parsed":
+            print(
+                "[glibc-parser] WARN: Parsing did not succeed. "
+                f"symbol={symbol} status={status} message={parse_result.get('message', '')}"
+            )
+            if 'source_path' in parse_result:	
+                print(f" - Analyzed File: {parse_result['source_path']}")
+        else:
+            parsed.append((symbol, parse_result))
+            if fingerprint:
+                redis_client.set_cached(fingerprint, parse_result, ttl_seconds=config["redis_cache_ttl"])
+
+    if parsed:
+        redis_client.store_syscall_mappings(parsed, batch_size=config["redis_batch_size"])
 
     print("[glibc-parser] Execution completed.")
 
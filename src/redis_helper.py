@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 class RedisClient:
@@ -30,3 +30,59 @@ class RedisClient:
             f"for `{wrapper_symbol}` with payload={payload}"
         )
 
+    def get_cached(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached parse payload by GlibcAstParser.result_fingerprint().
+
+        Returns None on a miss (always, until the real client is wired in).
+        """
+        if not self._connected:
+            raise RuntimeError("RedisClient.get_cached() called before connect().")
+
+        # Real client: raw = redis.get(f"syscall_cache:{fingerprint}"); return orjson.loads(raw) if raw else None
+        print(f"[glibc-parser] RedisClient.get_cached() called for syscall_cache:{fingerprint}")
+        return None
+
+    def set_cached(self, fingerprint: str, payload: Dict[str, Any], ttl_seconds: int) -> None:
+        if not self._connected:
+            raise RuntimeError("RedisClient.set_cached() called before connect().")
+
+        # Real client: redis.set(f"syscall_cache:{fingerprint}", json_payload, ex=ttl_seconds)
+        print(
+            "[glibc-parser] RedisClient.set_cached() called "
+            f"for syscall_cache:{fingerprint} (ttl={ttl_seconds}s)"
+        )
+
+    def store_syscall_mappings(
+        self,
+        items: Iterable[Tuple[str, Dict[str, Any]]],
+        batch_size: int = 100,
+    ) -> int:
+        """
+        Store many wrapper payloads, flushing one pipeline (no MULTI/EXEC) every batch_size items.
+
+        Returns the number of payloads written.
+        """
+        if not self._connected:
+            raise RuntimeError("RedisClient.store_syscall_mappings() called before connect().")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        pending: List[Tuple[str, Dict[str, Any]]] = []
+        written = 0
+        for item in items:
+            pending.append(item)
+            if len(pending) >= batch_size:
+                written += self._flush_pipeline(pending)
+                pending = []
+        if pending:
+            written += self._flush_pipeline(pending)
+        return written
+
+    def _flush_pipeline(self, batch: List[Tuple[str, Dict[str, Any]]]) -> int:
+        # Real client: pipe = redis.pipeline(transaction=False); pipe.hset(f"syscall:{sym}", mapping=payload)...; pipe.execute()
+        print(
+            "[glibc-parser] RedisClient pipeline flush "
+            f"({len(batch)} HSET(s): {', '.join(symbol for symbol, _ in batch)})"
+        )
+        return len(batch)
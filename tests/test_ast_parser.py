@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from src import ast_parser
+from src.ast_parser import GlibcAstParser
+
+pytestmark = pytest.mark.skipif(ast_parser.cindex is None, reason="libclang not available")
+
+
+def _analyse(tmp_path: Path, name: str, source: str):
+    source_file = tmp_path / name
+    source_file.write_text(source)
+    parser = GlibcAstParser(glibc_root=tmp_path, target_arch="x86_64", cache_dir=tmp_path / "cache", max_workers=1)
+    return parser.run_full_analysis(c_files=[source_file], enable_time64_round=False)
+
+
+def test_asm_only_source_survives_macro_prefilter(tmp_path):
+    results = _analyse(
+        tmp_path,
+        "rawsys.c",
+        "long\n"
+        "rawsys (long nr)\n"
+        "{\n"
+        "  long ret;\n"
+        '  asm volatile ("syscall" : "=a" (ret) : "0" (nr) : "rcx", "r11", "memory");\n'
+        "  return ret;\n"
+        "}\n",
+    )
+    assert "rawsys" in results
+    row = results.row(results.by_wrapper["rawsys"][0])
+    assert row.kernel_symbol == "asm(syscall)"
+    assert row.origin_macro == "asm"
+
+
+def test_else_branch_reports_negated_condition(tmp_path):
+    results = _analyse(
+        tmp_path,
+        "closeboth.c",
+        "#define INTERNAL_SYSCALL_CALL(name, args...) __syscall_stub (args)\n"
+        "extern long __syscall_stub (int, ...);\n"
+        "\n"
+        "int\n"
+        "closeboth (int fd, int flags)\n"
+        "{\n"
+        "  if (flags & 1)\n"
+        "    return INTERNAL_SYSCALL_CALL (close, fd);\n"
+        "  else\n"
+        "    return INTERNAL_SYSCALL_CALL (fsync, fd);\n"
+        "}\n",
+    )
+    contexts = {
+        row.kernel_symbol: row.conditional_context
+        for row in (results.row(index) for index in results.by_wrapper["closeboth"])
+    }
+    assert contexts == {
+        "close": "if ( flags & 1 )",
+        "fsync": "if ( !( flags & 1 ) )",
+    }
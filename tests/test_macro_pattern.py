@@ -0,0 +1,89 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src import ast_parser
+from src.ast_parser import GlibcAstParser, SYS_CALL_MACRO_PATTERN
+
+# One glibc-style call site per macro spelling the text fallback recognises
+MACRO_CALL_SITES = [
+    ("INLINE_SYSCALL", b"  return INLINE_SYSCALL (close, 1, fd);\n"),
+    ("INTERNAL_SYSCALL", b"  int r = INTERNAL_SYSCALL (getpid, 0);\n"),
+    ("INTERNAL_SYSCALL_DECL", b"  INTERNAL_SYSCALL_DECL (err);\n"),
+    ("INTERNAL_SYSCALL_CALL", b"  return INTERNAL_SYSCALL_CALL (gettid);\n"),
+    ("SYSCALL_CANCEL", b"  return SYSCALL_CANCEL (openat, fd, file, oflag, mode);\n"),
+    ("SYSCALL_CANCEL_IF", b"  return SYSCALL_CANCEL_IF(cond, read, fd, buf, nbytes);\n"),
+    ("__libc_do_syscall", b"  __libc_do_syscall(nr, a1, a2);\n"),
+    ("internal_syscall3", b"  internal_syscall3 (number, err, arg1, arg2, arg3);\n"),
+    ("__open_nocancel", b"  int fd = __open_nocancel (file, O_RDONLY);\n"),
+    ("__openat_nocancel", b"  int fd = __openat_nocancel (AT_FDCWD, file, O_RDONLY);\n"),
+]
+
+NON_MACRO_SITES = [
+    b"  __opena_nocancel (file, O_RDONLY);\n",
+    b"  inline_syscall (close, 1, fd);\n",
+    b"  Syscall_Cancel (read, fd, buf, nbytes);\n",
+    b"  internal_syscall7 (number, err);\n",
+    b"  /* INLINE_SYSCALL without a call */\n",
+]
+
+
+def _engines():
+    engines = {"literal": None, "regex": None}
+    if ast_parser._RE2_MACRO_PATTERN is not None:
+        engines["re2"] = None
+    database = ast_parser._build_macro_database()
+    if database is not None:
+        engines["hyperscan"] = database
+    return engines
+
+
+# Engine name -> hyperscan DB (None for the re-based engines); built once per session
+ENGINES = _engines()
+
+
+def _select_engine(monkeypatch, engine):
+    """re 기반 엔진은 RE2를 끄고, literal은 길이와 무관하게 리터럴 앵커 스캔을 쓰도록 고정."""
+    if engine in ("literal", "regex"):
+        monkeypatch.setattr(ast_parser, "_RE2_MACRO_PATTERN", None)
+    if engine == "literal":
+        monkeypatch.setattr(ast_parser, "MACRO_LITERAL_SEARCH_MIN_LENGTH", 0)
+    elif engine == "regex":
+        monkeypatch.setattr(ast_parser, "MACRO_LITERAL_SEARCH_MIN_LENGTH", sys.maxsize)
+
+
+@pytest.fixture(params=sorted(ENGINES))
+def find_macro(request, monkeypatch):
+    """엔진별로 GlibcAstParser._find_syscall_macro를 호출하는 함수."""
+    engine = request.param
+    _select_engine(monkeypatch, engine)
+    holder = SimpleNamespace(_macro_db=ENGINES[engine])
+    return lambda text: GlibcAstParser._find_syscall_macro(holder, text)
+
+
+@pytest.mark.parametrize("macro_name, site", MACRO_CALL_SITES, ids=[name for name, _ in MACRO_CALL_SITES])
+def test_each_macro_spelling_matches(find_macro, macro_name, site):
+    name, end = find_macro(site)
+    assert name == macro_name
+    assert site[end - 1 : end] == b"("
+
+
+@pytest.mark.parametrize("site", NON_MACRO_SITES)
+def test_near_miss_spellings_do_not_match(find_macro, site):
+    assert find_macro(site) is None
+
+
+def test_engines_agree_on_leftmost_match(monkeypatch):
+    text = b"".join(NON_MACRO_SITES) + b"".join(site for _, site in reversed(MACRO_CALL_SITES))
+    expected = SYS_CALL_MACRO_PATTERN.search(text)
+    assert expected is not None
+
+    results = {}
+    for engine, database in ENGINES.items():
+        with monkeypatch.context() as patch:
+            _select_engine(patch, engine)
+            holder = SimpleNamespace(_macro_db=database)
+            results[engine] = GlibcAstParser._find_syscall_macro(holder, text)
+
+    assert set(results.values()) == {(expected.group(1).decode("ascii"), expected.end())}